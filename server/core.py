@@ -11,6 +11,7 @@ from fastapi.exceptions import HTTPException, RequestValidationError
 from fastapi.openapi.utils import get_openapi
 from fastapi.responses import ORJSONResponse, Response
 from fastapi.utils import is_body_allowed_for_status_code
+from slowapi.errors import RateLimitExceeded
 from supertokens_python import (
     InputAppInfo,
     SupertokensConfig,
@@ -46,6 +47,8 @@ from supertokens_python.recipe.emailpassword.interfaces import (
 
 from utils.config import KanaeConfig
 from utils.errors import (
+    HTTP_404_BODY,
+    HTTP_404_DETAIL,
     HTTPExceptionMessage,
     RequestValidationErrorDetails,
     RequestValidationErrorMessage,
@@ -183,6 +186,10 @@ class Kanae(FastAPI):
             RequestValidationError,
             self.request_validation_error_handler,  # type: ignore
         )
+        self.add_exception_handler(
+            RateLimitExceeded,
+            self.rate_limit_exceeded_handler,  # type: ignore
+        )
 
     # SuperTokens recipes overrides
 
@@ -376,6 +383,16 @@ class Kanae(FastAPI):
         headers = getattr(exc, "headers", None)
         if not is_body_allowed_for_status_code(exc.status_code):
             return Response(status_code=exc.status_code, headers=headers)
+        if (
+            exc.status_code == status.HTTP_404_NOT_FOUND
+            and exc.detail == HTTP_404_DETAIL
+        ):
+            return Response(
+                content=HTTP_404_BODY,
+                status_code=status.HTTP_404_NOT_FOUND,
+                headers=headers,
+                media_type="application/json",
+            )
         message = HTTPExceptionMessage(detail=exc.detail)
         return ORJSONResponse(
             content=message.model_dump(), status_code=exc.status_code, headers=headers
@@ -397,6 +414,17 @@ class Kanae(FastAPI):
             content=message.model_dump(), status_code=status.HTTP_400_BAD_REQUEST
         )
 
+    async def rate_limit_exceeded_handler(
+        self, request: RouteRequest, exc: RateLimitExceeded
+    ) -> Response:
+        response = ORJSONResponse(
+            {"error": f"Rate limit exceeded: {exc.detail}"},
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        )
+        return request.app.state.limiter._inject_headers(
+            response, request.state.view_rate_limit
+        )
+
     ### Server-related utilities
 
     @asynccontextmanager
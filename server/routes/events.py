@@ -3,12 +3,14 @@ import uuid
 from typing import Annotated, Literal, Optional, Union
 
 from fastapi import Depends, Query
+from fastapi.responses import Response
 from pydantic import BaseModel
 from supertokens_python.recipe.session import SessionContainer
 from supertokens_python.recipe.session.framework.fastapi import verify_session
 from utils.errors import NotFoundException, NotFoundMessage
 from utils.pages import KanaePages, KanaeParams, paginate
 from utils.request import RouteRequest
+from utils.responses import DeleteResponse, delete_response
 from utils.router import KanaeRouter
 
 router = KanaeRouter(tags=["Events"])
@@ -146,10 +148,6 @@ async def edit_event(
     return EventsWithID(**dict(rows))
 
 
-class DeleteResponse(BaseModel, frozen=True):
-    message: str = "ok"
-
-
 # Depends on scopes
 @router.delete(
     "/events/{id}",
@@ -160,7 +158,7 @@ async def delete_event(
     request: RouteRequest,
     id: uuid.UUID,
     session: SessionContainer = Depends(verify_session),
-) -> DeleteResponse:
+) -> Response:
     """Deletes the specified event"""
     query = """
     DELETE FROM events
@@ -170,7 +168,7 @@ async def delete_event(
     status = await request.app.pool.execute(query, id, session.get_user_id())
     if status[-1] == "0":
         raise NotFoundException
-    return DeleteResponse()
+    return delete_response()
 
 
 # Depends on scopes
@@ -6,6 +6,7 @@ from typing import Annotated, Literal, Optional
 
 import asyncpg
 from fastapi import Depends, HTTPException, Query, status
+from fastapi.responses import Response
 from pydantic import BaseModel
 from supertokens_python.recipe.session import SessionContainer
 from supertokens_python.recipe.session.framework.fastapi import verify_session
@@ -17,7 +18,12 @@ from utils.errors import (
 )
 from utils.pages import KanaePages, KanaeParams, paginate
 from utils.request import RouteRequest
-from utils.responses import DeleteResponse
+from utils.responses import (
+    DeleteResponse,
+    JoinResponse,
+    delete_response,
+    join_response,
+)
 from utils.router import KanaeRouter
 
 router = KanaeRouter(tags=["Projects"])
@@ -219,7 +225,7 @@ async def delete_project(
     status = await request.app.pool.execute(query, id)
     if status[-1] == "0":
         raise NotFoundException
-    return DeleteResponse()
+    return delete_response()
 
 
 class CreateProject(BaseModel):
@@ -294,10 +300,6 @@ async def create_project(
         return PartialProjects(**dict(project_rows), tags=req.tags)
 
 
-class JoinResponse(BaseModel):
-    message: str
-
-
 @router.post(
     "/projects/{id}/join",
     responses={200: {"model": JoinResponse}, 409: {"model": HTTPExceptionMessage}},
@@ -307,7 +309,7 @@ async def join_project(
     request: RouteRequest,
     id: uuid.UUID,
     session: SessionContainer = Depends(verify_session),
-) -> JoinResponse:
+) -> Response:
     # The member is authenticated already, aka meaning that there is an existing member in our database
     query = """
     WITH insert_project_members AS (
@@ -332,7 +334,7 @@ async def join_project(
             )
         else:
             await tr.commit()
-            return JoinResponse(message="ok")
+            return join_response()
 
 
 class BulkJoinMember(BaseModel):
@@ -354,7 +356,7 @@ async def bulk_join_project(
     id: uuid.UUID,
     req: list[BulkJoinMember],
     session: SessionContainer = Depends(verify_session),
-) -> JoinResponse:
+) -> Response:
     if len(req) > 10:
         raise BadRequestException("Must be less than 10 members")
 
@@ -382,7 +384,7 @@ async def bulk_join_project(
             )
         else:
             await tr.commit()
-            return JoinResponse(message="ok")
+            return join_response()
 
 
 @router.delete(
@@ -394,7 +396,7 @@ async def leave_project(
     request: RouteRequest,
     id: uuid.UUID,
     session: SessionContainer = Depends(verify_session),
-) -> DeleteResponse:
+) -> Response:
     query = """
     DELETE FROM project_members
     WHERE project_id = $1 AND member_id = $2;
@@ -410,7 +412,7 @@ async def leave_project(
         WHERE id = $1 AND NOT EXISTS (SELECT 1 FROM project_members WHERE member_id = $1);
         """
         await connection.execute(update_role_query, session.get_user_id())
-        return DeleteResponse()
+        return delete_response()
 
 
 class UpgradeMemberRole(BaseModel):
@@ -444,7 +446,7 @@ async def modify_member(
     WHERE members.id = $2 AND EXISTS (SELECT 1 FROM upgrade_member WHERE upgrade_member.id = $2);
     """
     await request.app.pool.execute(query, id, req.id, req.role)
-    return DeleteResponse()
+    return delete_response()
 
 
 @router.get("/projects/me", responses={200: {"model": PartialProjects}})
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Annotated, Optional
 
 from fastapi import Depends, Query
+from fastapi.responses import Response
 from pydantic import BaseModel
 from supertokens_python.recipe.session import SessionContainer
 from supertokens_python.recipe.session.framework.fastapi import verify_session
@@ -11,7 +12,7 @@ from utils.errors import (
     NotFoundMessage,
 )
 from utils.request import RouteRequest
-from utils.responses import DeleteResponse
+from utils.responses import DeleteResponse, delete_response
 from utils.router import KanaeRouter
 
 router = KanaeRouter(tags=["Tags"])
@@ -105,7 +106,7 @@ async def delete_tag(
     request: RouteRequest,
     id: int,
     session: SessionContainer = Depends(verify_session),
-) -> DeleteResponse:
+) -> Response:
     """Remove specified tag"""
     query = """
     DELETE FROM tags
@@ -115,7 +116,7 @@ async def delete_tag(
     query_status = await request.app.pool.execute(query, id)
     if query_status[-1] == "0":
         raise NotFoundException
-    return DeleteResponse()
+    return delete_response()
 
 
 @router.post("/tags/create", responses={200: {"model": Tags}})
@@ -1,12 +1,9 @@
 from pydantic import BaseModel
+from utils.errors import HTTPExceptionMessage
 from utils.request import RouteRequest
 from utils.router import KanaeRouter
 
 
-class NotFound(BaseModel):
-    error: str = "Resource not found"
-
-
 class GetUser(BaseModel):
     user: str
 
@@ -17,7 +14,7 @@ router = KanaeRouter(prefix="/users", tags=["Users"])
 @router.get(
     "/get",
     response_model=GetUser,
-    responses={200: {"model": GetUser}, 404: {"model": NotFound}},
+    responses={200: {"model": GetUser}, 404: {"model": HTTPExceptionMessage}},
     name="Get users",
 )
 @router.limiter.limit("1/minute")
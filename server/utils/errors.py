@@ -1,3 +1,4 @@
+import orjson
 from fastapi import HTTPException
 from pydantic import BaseModel
 
@@ -33,3 +34,8 @@ class RequestValidationErrorMessage(BaseModel, frozen=True):
 class HTTPExceptionMessage(BaseModel, frozen=True):
     result: str = "error"
     detail: str
+
+
+# NotFoundException is almost always raised with the default detail,
+# so its error body is rendered once at import time
+HTTP_404_BODY = orjson.dumps(HTTPExceptionMessage(detail=HTTP_404_DETAIL).model_dump())
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+from functools import lru_cache
 from typing import Annotated, Any, Generic, Optional, Sequence, TypeVar
 
 import asyncpg
@@ -24,6 +26,9 @@ def create_paginate_query_from_text(query: str, params: AbstractParams) -> str:
     return f"{query} {suffix}".strip()
 
 
+# Queries passed in are constants at their call sites (or built from a small set
+# of fragments), so the cache stays small in practice
+@lru_cache(maxsize=256)
 def create_count_query_from_text(query: str) -> str:
     return f"SELECT count(*) FROM ({query}) AS __count_query__"  # noqa: S608
 
@@ -38,16 +43,20 @@ async def paginate(
 ) -> Any:
     params, raw_params = verify_params(params, "limit-offset")
 
+    paginated_query = create_paginate_query_from_text(query, params)
+
+    # The count and the page are independent reads, so they are run concurrently.
+    # This briefly holds two connections from the pool instead of one
     if raw_params.include_total:
-        total = await pool.fetchval(
-            create_count_query_from_text(query),
-            *args,
+        total, items = await asyncio.gather(
+            pool.fetchval(create_count_query_from_text(query), *args),
+            pool.fetch(paginated_query, *args),
         )
     else:
         total = None
+        items = await pool.fetch(paginated_query, *args)
 
-    items = await pool.fetch(create_paginate_query_from_text(query, params), *args)
-    items = [{**r} for r in items]
+    items = [dict(r) for r in items]
     t_items = await apply_items_transformer(items, transformer, async_=True)
 
     return create_page(
@@ -1,5 +1,25 @@
+import orjson
+from fastapi.responses import Response
 from pydantic import BaseModel
 
 
-class DeleteResponse(BaseModel):
+class DeleteResponse(BaseModel, frozen=True):
     message: str = "ok"
+
+
+class JoinResponse(BaseModel, frozen=True):
+    message: str
+
+
+# These responses never vary, so they are rendered once and served as raw bytes,
+# skipping response model validation and serialization on every request
+DELETE_RESPONSE_BODY = orjson.dumps(DeleteResponse().model_dump())
+JOIN_RESPONSE_BODY = orjson.dumps(JoinResponse(message="ok").model_dump())
+
+
+def delete_response() -> Response:
+    return Response(content=DELETE_RESPONSE_BODY, media_type="application/json")
+
+
+def join_response() -> Response:
+    return Response(content=JOIN_RESPONSE_BODY, media_type="application/json")
@@ -1,9 +1,10 @@
 from pathlib import Path
+from typing import Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from slowapi import Limiter
-from slowapi.util import get_remote_address
 
 from .config import KanaeConfig
 
@@ -16,25 +17,54 @@ class PartialConfig(BaseModel, frozen=True):
     dev_mode: bool = False
 
 
+def _load_config() -> PartialConfig:
+    config = KanaeConfig(CONFIG_PATH)
+    return PartialConfig(
+        redis_uri=config["redis_uri"],
+        ratelimits=config["kanae"]["ratelimits"],
+        dev_mode=config["kanae"]["dev_mode"],
+    )
+
+
+def _get_client_host(request: Request) -> str:
+    # Reads the ASGI client tuple directly instead of building an Address via
+    # request.client, falling back the same way slowapi's get_remote_address does
+    client = request.scope.get("client")
+    return client[0] if client and client[0] else "127.0.0.1"
+
+
+def _create_limiter(config: PartialConfig) -> Limiter:
+    return Limiter(
+        key_func=_get_client_host,
+        storage_uri=config.redis_uri,
+        default_limits=config.ratelimits,  # type: ignore
+        enabled=not config.dev_mode,
+    )
+
+
+# Every router shares one limiter, and thus one Redis client and connection pool,
+# instead of each router opening its own. Note that this means importing this
+# module reads config.yml, even if no router is ever constructed
+_CONFIG = _load_config()
+_LIMITER = _create_limiter(_CONFIG)
+
+
 class KanaeRouter(APIRouter):
     limiter: Limiter
 
-    def __init__(self, **kwargs):
+    def __init__(
+        self,
+        *,
+        limiter: Optional[Limiter] = None,
+        config: Optional[PartialConfig] = None,
+        **kwargs,
+    ):
+        kwargs.setdefault("default_response_class", ORJSONResponse)
         super().__init__(**kwargs)
 
-        # This isn't my favorite implementation, but will do for now - Noelle
-        self._config = self._load_config()
-        self.limiter = Limiter(
-            key_func=get_remote_address,
-            storage_uri=self._config.redis_uri,
-            default_limits=self._config.ratelimits,  # type: ignore
-            enabled=not self._config.dev_mode,
-        )
-
-    def _load_config(self) -> PartialConfig:
-        config = KanaeConfig(CONFIG_PATH)
-        return PartialConfig(
-            redis_uri=config["redis_uri"],
-            ratelimits=config["kanae"]["ratelimits"],
-            dev_mode=config["kanae"]["dev_mode"],
-        )
+        # Limits are attached by decorators at import time, well before the app's
+        # lifespan runs, so the shared limiter is used unless a limiter or a config
+        # to build one from is passed in
+        if limiter is None:
+            limiter = _LIMITER if config is None else _create_limiter(config)
+        self.limiter = limiter